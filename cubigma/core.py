@@ -21,8 +21,9 @@ class DeterministicRandomCore:
         self.seed_random(strengthened_key_phrase)
 
     def seed_random(self, strengthened_key_phrase: str) -> None:
-        # Derive a deterministic seed from the sanitized_key_phrase
-        seed = int(hashlib.sha256(strengthened_key_phrase.encode()).hexdigest(), 16)
+        # Derive a deterministic seed from the sanitized_key_phrase (reading the raw digest is the same big-endian
+        # integer as parsing its hexdigest, without building and parsing the hex string)
+        seed = int.from_bytes(hashlib.sha256(strengthened_key_phrase.encode()).digest(), "big")
 
         # Initialize a random generator with the deterministic seed
         rng = random.Random(seed)
@@ -57,20 +58,21 @@ class DeterministicRandomCore:
         #     shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
         # return shuffled
 
+        # Random.shuffle walks the list backwards drawing _randbelow(i + 1), exactly the index randint(0, i) draws,
+        # so this is the same deterministic Fisher-Yates shuffle without the randint/randrange call overhead
         shuffled = list(sequence)
-        for i in range(len(shuffled) - 1, 0, -1):
-            j = self.get_random_int(0, i)  # Generate a random index deterministically
-            shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
+        self.rng.shuffle(shuffled)
         return shuffled
 
 
 def get_independently_deterministic_random_rotor_info(
     combined_seed: str, axis_choices: list[str], direction_choices: list[int], max_num: int
 ) -> tuple[str, int, int]:
-    random.seed(combined_seed)
-    axis = random.choice(axis_choices)
-    rotate_dir = random.choice(direction_choices)
-    slice_idx_to_rotate = random.randint(0, max_num)
+    # A private generator gives the same sequence as seeding the global one, without disturbing the global state
+    rng = random.Random(combined_seed)
+    axis = rng.choice(axis_choices)
+    rotate_dir = rng.choice(direction_choices)
+    slice_idx_to_rotate = rng.randint(0, max_num)
     return axis, rotate_dir, slice_idx_to_rotate
 
 
@@ -92,21 +94,20 @@ def get_non_deterministically_random_shuffled(input_to_shuffle: list) -> list:
 
 def shuffle_for_input(strengthened_key_phrase: str, sequence: Sequence[T]) -> list[T]:
     # Derive a deterministic seed from the sanitized_key_phrase
-    seed = int(hashlib.sha256(strengthened_key_phrase.encode()).hexdigest(), 16)
+    seed = int.from_bytes(hashlib.sha256(strengthened_key_phrase.encode()).digest(), "big")
 
     # Initialize a random generator with the deterministic seed
     rng = random.Random(seed)
 
+    # Same draws as a randint(0, i) Fisher-Yates loop (see DeterministicRandomCore.shuffle)
     shuffled = list(sequence)
-    for i in range(len(shuffled) - 1, 0, -1):
-        j = rng.randint(0, i)  # Generate a random index deterministically
-        shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
+    rng.shuffle(shuffled)
     return shuffled
 
 
 def random_int_for_input(strengthened_key_phrase: str, min_num: int, max_num: int) -> int:
     # Derive a deterministic seed from the sanitized_key_phrase
-    seed = int(hashlib.sha256(strengthened_key_phrase.encode()).hexdigest(), 16)
+    seed = int.from_bytes(hashlib.sha256(strengthened_key_phrase.encode()).digest(), "big")
 
     # Initialize a random generator with the deterministic seed
     rng = random.Random(seed)
@@ -119,16 +120,16 @@ def strengthen_key(
     key_phrase: str, salt: None | bytes = None, iterations: int = 200_000, key_length: int = 32
 ) -> tuple[str, str]:
     """
-    Strengthen a user-provided key using Argon2 key derivation.
+    Strengthen a user-provided key using PBKDF2-HMAC-SHA256 key derivation.
 
     Args:
         key_phrase (str): The weak key phrase provided by the user.
         salt (bytes): Optional salt. If None, generates a random 16-byte salt.
-        iterations (int): Number of iterations for PBKDF2 (default is 100,000).
+        iterations (int): Number of iterations for PBKDF2 (default is 200,000).
         key_length (int): The desired length of the derived key in bytes (default is 32 bytes for 256-bit key).
 
     Returns:
-        bytes: A securely derived key & the salt used
+        tuple[str, str]: The base64-encoded derived key & the base64-encoded salt used
     """
     if salt is None:
         salt = os.urandom(16)  # Use a secure random salt if not provided
@@ -139,6 +140,7 @@ def strengthen_key(
     if not key_length or key_length < 0:
         raise ValueError("key_length must be a positive integer")
     key_phrase_bytes = key_phrase.encode("utf-8")
+    # A single pbkdf2_hmac call runs every iteration inside OpenSSL (SHA-NI accelerated where the CPU supports it)
     key = hashlib.pbkdf2_hmac("sha256", key_phrase_bytes, salt, iterations, dklen=key_length)  # Derived key length
     b64_key = base64.b64encode(key).decode("utf-8")  # always 44 chars long
     b64_salt = base64.b64encode(salt).decode("utf-8")  # always 24 chars long
@@ -24,6 +24,7 @@ from cubigma.utils import (  # Used in packaging & unit testing
     rotate_slice_of_cube,
     sanitize,
     split_to_human_readable_symbols,
+    _find_symbols,
     _user_perceived_length,
 )
 
@@ -64,11 +65,9 @@ class Cubigma:
         return complete
 
     def _run_message_through_plugboard(self, full_message: str) -> str:
-        message_after_plugboard_ops = ""
-        for symbol in full_message:
-            corresponding_symbol = self.plugboard.get(symbol, symbol)  # Attempt to lookup, fail over to original symbol
-            message_after_plugboard_ops += corresponding_symbol
-        return message_after_plugboard_ops
+        plugboard = self.plugboard
+        # Attempt to lookup, fail over to original symbol; join once rather than growing the string per symbol
+        return "".join([plugboard.get(symbol, symbol) for symbol in full_message])
 
     def _run_trio_through_reflector(
         self, char_trio: str, strengthened_key_phrase: str, num_of_encoded_trios: int
@@ -85,11 +84,9 @@ class Cubigma:
         Returns:
             str: The reflected trio.
         """
-        reflected_symbols = []
         # Reflect each symbol
-        for symbol in split_to_human_readable_symbols(char_trio):
-            reflected_symbol = self.reflector[symbol]
-            reflected_symbols.append(reflected_symbol)
+        reflector = self.reflector
+        reflected_symbols = [reflector[symbol] for symbol in split_to_human_readable_symbols(char_trio)]
 
         # Hash the trio to determine the reordering
         reflected_trio = "".join(reflected_symbols)
@@ -97,7 +94,7 @@ class Cubigma:
         trio_hash = get_hash_of_string_in_bytes(hash_input)
 
         # Determine the reordering using the first 3 bytes of the hash
-        order = sorted(range(LENGTH_OF_TRIO), key=lambda i: trio_hash[i])
+        order = sorted(range(LENGTH_OF_TRIO), key=trio_hash.__getitem__)
 
         # Reorder the trio based on the computed order
         reordered_reflected_trio = "".join(reflected_symbols[i] for i in order)
@@ -112,30 +109,19 @@ class Cubigma:
         is_encrypting: bool,
     ) -> str:
         cur_trio = char_trio
+        # Every rotor has the same dimensions, and stepping a rotor never changes them
+        num_blocks = len(rotors[0]) if rotors else 0
         for rotor_number, rotor in enumerate(rotors):
             print(f"{cur_trio=}")
             # Step the rotors forward immediately before encoding each trio on each rotor
-            coordinate_by_char = {}
             stepped_rotor = self._step_rotor(rotor, rotor_number, key_phrase)
             rotors[rotor_number] = stepped_rotor
 
             individual_symbols = split_to_human_readable_symbols(cur_trio)
-            for frame_idx, cur_frame in enumerate(stepped_rotor):
-                for row_idx, cur_line in enumerate(cur_frame):
-                    if any(symbol in cur_line for symbol in individual_symbols):
-                        if individual_symbols[0] in cur_line:
-                            point = (frame_idx, row_idx, cur_line.index(individual_symbols[0]))
-                            coordinate_by_char[individual_symbols[0]] = point
-                        if individual_symbols[1] in cur_line:
-                            point = (frame_idx, row_idx, cur_line.index(individual_symbols[1]))
-                            coordinate_by_char[individual_symbols[1]] = point
-                        if individual_symbols[2] in cur_line:
-                            point = (frame_idx, row_idx, cur_line.index(individual_symbols[2]))
-                            coordinate_by_char[individual_symbols[2]] = point
+            coordinate_by_char = _find_symbols(individual_symbols, stepped_rotor)
             if len(coordinate_by_char) != LENGTH_OF_TRIO:
                 print("This is unexpected")
             orig_indices = [coordinate_by_char[cur_char] for cur_char in individual_symbols]
-            num_blocks = len(stepped_rotor)
             encrypted_coordinates = get_encrypted_coordinates(
                 orig_indices[0],
                 orig_indices[1],
@@ -149,11 +135,9 @@ class Cubigma:
                 self._num_trios_encoded += 1
             else:
                 self._num_trios_encoded -= 1
-            encrypted_char_1 = get_symbol_for_coordinates(encrypted_coordinates[0], stepped_rotor)
-            encrypted_char_2 = get_symbol_for_coordinates(encrypted_coordinates[1], stepped_rotor)
-            encrypted_char_3 = get_symbol_for_coordinates(encrypted_coordinates[2], stepped_rotor)
-            list_of_encrypted_chars = [encrypted_char_1, encrypted_char_2, encrypted_char_3]
-            encrypted_trio = "".join(list_of_encrypted_chars)
+            encrypted_trio = "".join(
+                [get_symbol_for_coordinates(coordinate, stepped_rotor) for coordinate in encrypted_coordinates]
+            )
             cur_trio = encrypted_trio
             # ToDo: Do we need to save stepped_rotor back into
         return cur_trio
@@ -180,11 +164,9 @@ class Cubigma:
                 for visible_symbol in split_to_human_readable_symbols(
                     sanitized_line, expected_number_of_graphemes=None
                 ):
-                    len_before = len(unique_symbols)
-                    unique_symbols.add(visible_symbol)
-                    len_after = len(unique_symbols)
-                    if len_before == len_after:
+                    if visible_symbol in unique_symbols:
                         print(f"Duplicate symbol found: {visible_symbol}")
+                    unique_symbols.add(visible_symbol)
                     symbols.append(visible_symbol)
                     symbols_loaded += 1
                     if symbols_loaded >= symbols_to_load:
@@ -249,7 +231,7 @@ class Cubigma:
             )
 
         # Remove all trios with the TOTAL_NOISE characters
-        decrypted_message = ""
+        decrypted_chunks = []
         message_split_into_symbols = split_to_human_readable_symbols(
             encrypted_message, expected_number_of_graphemes=None
         )
@@ -259,7 +241,9 @@ class Cubigma:
             encrypted_chunk = "".join(encrypted_chunk_symbols)
             decrypted_chunk = self.decode_string(encrypted_chunk, key_phrase)
             if NOISE_SYMBOL not in decrypted_chunk:
-                decrypted_message += decrypted_chunk
+                decrypted_chunks.append(decrypted_chunk)
+        # Join once at the end instead of growing the message string one trio at a time
+        decrypted_message = "".join(decrypted_chunks)
         print(f"{decrypted_message=}")
         return decrypted_message
 
@@ -280,7 +264,7 @@ class Cubigma:
                 "Machine is not prepared yet! Call .prepare_machine(key_phrase) before encoding or decoding"
             )
         assert _user_perceived_length(sanitized_message) % LENGTH_OF_TRIO == 0, "Message is not properly sanitized!"
-        encrypted_message = ""
+        encrypted_chunks = []
         message_split_into_symbols = split_to_human_readable_symbols(
             sanitized_message, expected_number_of_graphemes=None
         )
@@ -289,8 +273,8 @@ class Cubigma:
             orig_chunk_symbols = message_split_into_symbols[i:end_idx]
             orig_chunk = "".join(orig_chunk_symbols)
             encrypted_chunk = self._get_encrypted_letter_trio(orig_chunk, key_phrase, is_encrypting)
-            encrypted_message += encrypted_chunk
-        return encrypted_message
+            encrypted_chunks.append(encrypted_chunk)
+        return "".join(encrypted_chunks)
 
     def encrypt_message(self, clear_text_message: str, key_phrase: str) -> str:
         """
@@ -356,8 +340,9 @@ class Cubigma:
         strengthened_key_phrase, bases64_encoded_salt = strengthen_key(key_phrase, salt=salt_bytes)
         print(f"{strengthened_key_phrase=}")
         print(f"{bases64_encoded_salt=}")
+        known_symbols = set(self._symbols)
         for character in split_to_human_readable_symbols(strengthened_key_phrase, expected_number_of_graphemes=44):
-            if character not in self._symbols:
+            if character not in known_symbols:
                 raise ValueError("Key was strengthened to include an invalid character")
 
         # Setup random seeds
@@ -24,7 +24,7 @@ def triple_to_index(t0, t1, t2, size=125):
     Given three indices (each in [0..size-1]),
     return the integer in [0..size^3 - 1].
     """
-    return t0 * (size**2) + t1 * size + t2
+    return (t0 * size + t1) * size + t2
 
 
 def index_to_triple(idx, size=125):
@@ -33,10 +33,8 @@ def index_to_triple(idx, size=125):
     Given idx in [0..size^3 - 1],
     return (t0, t1, t2) each in [0..size-1].
     """
-    t0 = idx // (size**2)
-    remainder = idx % (size**2)
-    t1 = remainder // size
-    t2 = remainder % size
+    remainder, t2 = divmod(idx, size)
+    t0, t1 = divmod(remainder, size)
     return (t0, t1, t2)
 
 
@@ -1,7 +1,6 @@
 """ Useful shared utilities for the cubigma project. """
 
-from copy import deepcopy
-from itertools import chain
+from itertools import chain, islice, permutations
 import math
 from numbers import Number
 from pathlib import Path
@@ -23,6 +22,12 @@ from cubigma.core import (
 LENGTH_OF_TRIO = 3
 NOISE_SYMBOL = ""
 
+_ESCAPE_SEQUENCE_RE = regex.compile(r"\\([nt\\])")
+_ESCAPED_CHARACTERS = {"n": "\n", "t": "\t", "\\": "\\"}
+_GRAPHEME_RE = regex.compile(r"\X")
+_PAD_SYMBOLS = ("", "", "")
+_TRIO_ORDERINGS = tuple(permutations(range(LENGTH_OF_TRIO)))  # Every ordering of 3 items, e.g. (2, 0, 1)
+
 
 def _find_symbol(symbol_to_move: str, playfair_cube: list[list[list[str]]]) -> tuple[int, int, int]:
     """Finds the frame, row, and column of the given symbol in the playfair cube."""
@@ -34,10 +39,27 @@ def _find_symbol(symbol_to_move: str, playfair_cube: list[list[list[str]]]) -> t
     raise ValueError(f"Symbol '{symbol_to_move}' not found in playfair_cube.")
 
 
-def _get_flat_index(x, y, z, size_x, size_y):
-    if size_x <= 0 or size_y <= 0:
+def _find_symbols(symbols: list[str], playfair_cube: list[list[list[str]]]) -> dict[str, tuple[int, int, int]]:
+    """Finds the frame, row, and column of each given symbol, stopping as soon as all of them are found."""
+    symbols_to_find = set(symbols)
+    coordinate_by_symbol: dict[str, tuple[int, int, int]] = {}
+    for frame_idx, frame in enumerate(playfair_cube):
+        for row_idx, row in enumerate(frame):
+            for symbol in [symbol for symbol in symbols_to_find if symbol in row]:
+                coordinate_by_symbol[symbol] = frame_idx, row_idx, row.index(symbol)
+                symbols_to_find.discard(symbol)
+            if not symbols_to_find:
+                return coordinate_by_symbol
+    return coordinate_by_symbol
+
+
+def _get_flat_index(x, y, z, size_z, size_y):
+    """Row-major index of (x, y, z) in a grid whose rows hold size_z symbols and whose frames hold size_y rows."""
+    if size_z <= 0 or size_y <= 0:
         raise ValueError("size dimensions must be greater than 0")
-    return x * size_y * size_x + y * size_x + z
+    stride_y = size_z
+    stride_x = size_y * stride_y
+    return x * stride_x + y * stride_y + z
 
 
 def _get_prefix_order_number_trio(order_number: int) -> str:
@@ -45,22 +67,22 @@ def _get_prefix_order_number_trio(order_number: int) -> str:
     assert len(order_number_str) == 1, "Invalid order number"
     # pad_symbols = ["", "", "", order_number_str]
     pad_symbols = ["", "", order_number_str]
-    shuffled_pad_symbols = get_non_deterministically_random_shuffled(pad_symbols)
-    return "".join(shuffled_pad_symbols)
+    # Picking one of the 6 orderings takes a single random draw, rather than shuffling a copy of the list
+    ordering = _TRIO_ORDERINGS[get_non_deterministically_random_int(0, len(_TRIO_ORDERINGS) - 1)]
+    return "".join([pad_symbols[idx] for idx in ordering])
 
 
 def _get_random_noise_chunk(rotor: list[list[list[str]]]) -> str:
     num_blocks = len(rotor)
     lines_per_block = len(rotor[0])
     symbols_per_line = len(rotor[0][0])
+    num_symbols = num_blocks * lines_per_block * symbols_per_line
     noise_trio_symbols = [NOISE_SYMBOL]
     while len(noise_trio_symbols) < LENGTH_OF_TRIO:
-        coordinate = (
-            get_non_deterministically_random_int(0, num_blocks - 1),
-            get_non_deterministically_random_int(0, lines_per_block - 1),
-            get_non_deterministically_random_int(0, symbols_per_line - 1),
-        )
-        x, y, z = coordinate
+        # Draw one flat index and split it into coordinates, rather than drawing each coordinate separately
+        flat_index = get_non_deterministically_random_int(0, num_symbols - 1)
+        xy, z = divmod(flat_index, symbols_per_line)
+        x, y = divmod(xy, lines_per_block)
         found_symbol = rotor[x][y][z]
         if found_symbol not in noise_trio_symbols:
             noise_trio_symbols.append(found_symbol)
@@ -80,17 +102,23 @@ def _is_valid_coord(coord: tuple[int, int, int], inner_grid: list[list[list]]) -
     return is_z_valid
 
 
+def _is_single_codepoint_text(s: str) -> bool:
+    """Whether each grapheme in the string is a single code point (ASCII, except the CR LF cluster)."""
+    return isinstance(s, str) and s.isascii() and "\r" not in s
+
+
 def _pad_chunk_with_rand_pad_symbols(chunk: str) -> str:
     if len(chunk) < 1:
         raise ValueError("Chunk cannot be empty")
-    pad_symbols = ["", "", ""]
-    max_pad_idx = len(pad_symbols) - 1
-    while len(chunk) < LENGTH_OF_TRIO:
-        new_random_number = get_non_deterministically_random_int(0, max_pad_idx)
-        random_pad_symbol = pad_symbols[new_random_number]
-        if random_pad_symbol not in chunk:
-            chunk += random_pad_symbol
-    return chunk
+    num_pad_symbols_needed = LENGTH_OF_TRIO - len(chunk)
+    if num_pad_symbols_needed < 1:
+        return chunk
+    available_pad_symbols = [symbol for symbol in _PAD_SYMBOLS if symbol not in chunk]
+    if num_pad_symbols_needed > len(available_pad_symbols):
+        num_available = len(available_pad_symbols)
+        raise ValueError(f"Chunk needs {num_pad_symbols_needed} pad symbols, but only {num_available} remain")
+    shuffled_pad_symbols = get_non_deterministically_random_shuffled(available_pad_symbols)
+    return chunk + "".join(shuffled_pad_symbols[:num_pad_symbols_needed])
 
 
 def _read_and_validate_config(mode: str = "") -> tuple[int, int, list[int], str, bool, list[str]]:
@@ -116,7 +144,7 @@ def _read_and_validate_config(mode: str = "") -> tuple[int, int, list[int], str,
         raise ValueError("ROTORS_TO_USE not found in config.json")
     if not isinstance(rotors_to_use, list):
         raise ValueError("ROTORS_TO_USE (in config.json) must be a list of integers")
-    seen_rotor_values: list[int] = []
+    seen_rotor_values: set[int] = set()
     for index, rotor_item in enumerate(rotors_to_use):
         if not isinstance(rotor_item, int):
             raise ValueError(f"ROTORS_TO_USE (in config.json) contains a non-integer value at index: {index}")
@@ -125,7 +153,7 @@ def _read_and_validate_config(mode: str = "") -> tuple[int, int, list[int], str,
             raise ValueError(f"{first_half} values must be between 0 & the number of rotors generated")
         if rotor_item in seen_rotor_values:
             raise ValueError("ROTORS_TO_USE (in config.json) all rotor values must be unique")
-        seen_rotor_values.append(rotor_item)
+        seen_rotor_values.add(rotor_item)
 
     if not mode:
         mode = config.get("ENCRYPT_OR_DECRYPT", None)
@@ -148,18 +176,19 @@ def _read_and_validate_config(mode: str = "") -> tuple[int, int, list[int], str,
     if not isinstance(plugboard_values, list):
         raise ValueError("PLUGBOARD (in config.json) must be a list of symbol pairs")
 
-    seen_plugboard_symbols: list[str] = []
+    seen_plugboard_symbols: set[str] = set()
     for index, raw_plugboard_val in enumerate(plugboard_values):
         if not isinstance(raw_plugboard_val, str):
             raise ValueError(f"PLUGBOARD (in config.json) contains a non-string value at index: {index}")
-        if _user_perceived_length(raw_plugboard_val) != 2:
+        plugboard_symbols = split_to_human_readable_symbols(raw_plugboard_val, expected_number_of_graphemes=None)
+        if len(plugboard_symbols) != 2:
             first_half = "PLUGBOARD (in config.json) all plugboard values must be pairs of symbols."
-            raise ValueError(f"{first_half} index {index} has length of {_user_perceived_length(raw_plugboard_val)}")
-        for plugboard_symbol in split_to_human_readable_symbols(raw_plugboard_val, expected_number_of_graphemes=2):
+            raise ValueError(f"{first_half} index {index} has length of {len(plugboard_symbols)}")
+        for plugboard_symbol in plugboard_symbols:
             if plugboard_symbol in seen_plugboard_symbols:
                 first_half = "PLUGBOARD (in config.json) all plugboard symbols must be unique."
                 raise ValueError(f"{first_half} {plugboard_symbol} appears more than once")
-            seen_plugboard_symbols.append(plugboard_symbol)
+            seen_plugboard_symbols.add(plugboard_symbol)
 
     return cube_length, num_rotors_to_make, rotors_to_use, mode, should_use_steganography, plugboard_values
 
@@ -188,7 +217,7 @@ def _shuffle_cube_with_key_phrase(
     value_unique_to_each_rotor: str,
 ) -> list[list[list[str]]]:
     """
-    Shuffles the elements of a 3-dimensional list in-place for cryptographic use.
+    Shuffles the elements of a 3-dimensional list into a new cube of the same shape for cryptographic use.
 
     Args:
         strengthened_key_phrase (str): strengthened, sanitized key
@@ -203,16 +232,18 @@ def _shuffle_cube_with_key_phrase(
 
     shuffled_flat = shuffle_for_input(f"{strengthened_key_phrase}|{value_unique_to_each_rotor}", flat_cube)
 
-    # Reshape the flattened list back into the original cube structure
-    reshaped_cube = deepcopy(orig_cube)
+    # Reshape the flattened list back into the original cube structure. Every cell is overwritten, so the rows are
+    # built straight from the shuffled symbols instead of deep-copying the original cube first.
     flat_iter = iter(shuffled_flat)
-    for outer in reshaped_cube:
-        for inner in outer:
-            for i in range(len(inner)):
-                inner[i] = next(flat_iter)
+    reshaped_cube = [[list(islice(flat_iter, len(row))) for row in frame] for frame in orig_cube]
     return reshaped_cube
 
 
+def _unescape(symbol: str) -> str:
+    """Expands the \\n, \\t, and \\\\ escape sequences used in characters.txt in a single pass."""
+    return _ESCAPE_SEQUENCE_RE.sub(lambda match: _ESCAPED_CHARACTERS[match.group(1)], symbol)
+
+
 def generate_cube_from_symbols(
     symbols: list[str], num_blocks: int = -1, lines_per_block: int = -1, symbols_per_line: int = -1
 ) -> list[list[list[str]]]:
@@ -224,13 +255,10 @@ def generate_cube_from_symbols(
             start_idx = block * symbols_per_block + row * symbols_per_line
             end_idx = block * symbols_per_block + (row + 1) * symbols_per_line
             raw_symbols = symbols[start_idx:end_idx]
-            if _user_perceived_length("".join(raw_symbols)) != symbols_per_line:
+            # Each symbol came from split_to_human_readable_symbols, so it is already one grapheme cluster
+            if len(raw_symbols) != symbols_per_line:
                 raise ValueError("Something has failed")
-            new_row = [i.replace("\\n", "\n").replace("\\t", "\t").replace("\\\\", "\\") for i in raw_symbols]
-            # new_row = []
-            # for i in raw_symbols:
-            #     foo = i.replace("\\n", "\n").replace("\\t", "\t").replace("\\\\", "\\")
-            #     new_row.append(foo)
+            new_row = [_unescape(i) if "\\" in i else i for i in raw_symbols]
             assert len(new_row) == symbols_per_line, "Something else has failed."
             new_frame.append(new_row)
         cube.append(new_frame)
@@ -248,7 +276,7 @@ def generate_plugboard(plugboard_values: list[str]) -> dict[str, str]:
         a dictionary of one symbol to another
     """
     plugboard = {}
-    seen_plugboard_symbols = []
+    seen_plugboard_symbols: set[str] = set()
     for index, symbol_pair in enumerate(plugboard_values):
         symbols = split_to_human_readable_symbols(symbol_pair, expected_number_of_graphemes=None)
         if len(symbols) != 2:
@@ -258,7 +286,7 @@ def generate_plugboard(plugboard_values: list[str]) -> dict[str, str]:
         symbol_2 = symbols[1]
         if symbol_1 in seen_plugboard_symbols or symbol_2 in seen_plugboard_symbols:
             raise ValueError("Cannot create a plugboard with duplicate symbols")
-        seen_plugboard_symbols += [symbol_1, symbol_2]
+        seen_plugboard_symbols.update((symbol_1, symbol_2))
         plugboard[symbol_1] = symbol_2
         plugboard[symbol_2] = symbol_1
     return plugboard
@@ -275,30 +303,28 @@ def generate_reflector(symbols: list[str], random_core: DeterministicRandomCore)
     Returns:
         a dictionary of one symbol to another
     """
-    # Create a list of all possible symbols
-    new_symbols = random_core.shuffle(symbols.copy())
+    # Create a list of all possible symbols (shuffle returns a new list, leaving the input untouched)
+    new_symbols = random_core.shuffle(symbols)
 
-    # Create pairs and map them bidirectionally
-    reflector = {}
     num_symbols = len(new_symbols)
-    last_index = num_symbols - 1
-    middle_index = int(num_symbols / 2.0)
-    is_length_odd = middle_index != num_symbols / 2.0
     if num_symbols == 1:
         only_symbol = symbols[0]
-        reflector[only_symbol] = only_symbol
-        return reflector
-    for i in range(0, middle_index):
-        if i == 0 and is_length_odd:
-            q1, q2 = new_symbols[i], new_symbols[last_index - i]
-            q3 = new_symbols[middle_index]
-            reflector[q1] = q2
-            reflector[q2] = q3
-            reflector[q3] = q1
-        else:
-            q1, q2 = new_symbols[i], new_symbols[last_index - i]
-            reflector[q1] = q2
-            reflector[q2] = q1
+        return {only_symbol: only_symbol}
+
+    # Pair the first half with the reversed second half, and map each pair bidirectionally
+    last_index = num_symbols - 1
+    middle_index = num_symbols // 2
+    first_half = new_symbols[:middle_index]
+    stop_index = last_index - middle_index
+    second_half = new_symbols[last_index:stop_index:-1]
+    reflector = dict(zip(first_half, second_half))
+    reflector.update(zip(second_half, first_half))
+
+    # With an odd number of symbols, the leftover middle symbol joins the first pair in a 3-cycle
+    if num_symbols % 2 == 1:
+        q1, q2, q3 = new_symbols[0], new_symbols[last_index], new_symbols[middle_index]
+        reflector[q2] = q3
+        reflector[q3] = q1
     return reflector
 
 
@@ -338,7 +364,7 @@ def generate_rotors(
         raise ValueError("NUMBER_OF_ROTORS_TO_GENERATE (in config.json) must be a non-empty list of integers")
     if not orig_key_length or not isinstance(orig_key_length, int):
         raise ValueError("orig_key_length must be a integer greater than 0")
-    seen_rotor_values: list[int] = []
+    seen_rotor_values: set[int] = set()
     for rotor_item in rotors_to_use:
         if (
             not isinstance(rotor_item, int)
@@ -348,29 +374,21 @@ def generate_rotors(
         ):
             first_half = "NUMBER_OF_ROTORS_TO_GENERATE (in config.json) all rotor values must be"
             raise ValueError(f"{first_half} unique integers between 0 & the number of rotors generated")
-        seen_rotor_values.append(rotor_item)
+        seen_rotor_values.add(rotor_item)
 
-    generated_rotors = []
+    rotors_ready_for_use: list[list[list[list[str]]]] = []
     arbitrary_prime_1 = 7
     arbitrary_prime_2 = 13
-    for generated_rotor_idx in range(num_rotors_to_make):
-        raw_rotor = deepcopy(raw_cube)
+    # Each rotor depends only on its own index, so only the rotors that will actually be used are generated
+    for generated_rotor_idx in rotors_to_use:
         base = (generated_rotor_idx + arbitrary_prime_1) * arbitrary_prime_2
         exponent = orig_key_length + generated_rotor_idx
         value_unique_to_each_rotor = str(math.pow(base, exponent))
 
-        are_all_pad_symbols_in_same_frame = True
-        while are_all_pad_symbols_in_same_frame:
-            shuffled_rotor = _shuffle_cube_with_key_phrase(
-                strengthened_key_phrase, raw_rotor, value_unique_to_each_rotor
-            )
-            # ToDo: We need to ensure that all three pad symbols are NOT on the same x, y, or z as each other
-            are_all_pad_symbols_in_same_frame = False  # ToDo: Implement this
-        generated_rotors.append(shuffled_rotor)
-
-    rotors_ready_for_use: list[list[list[list[str]]]] = []
-    for desired_rotor_index in rotors_to_use:
-        rotors_ready_for_use.append(generated_rotors[desired_rotor_index])
+        # ToDo: We need to ensure that all three pad symbols are NOT on the same x, y, or z as each other
+        # _shuffle_cube_with_key_phrase builds a new cube, so every rotor can read from the same raw_cube
+        shuffled_rotor = _shuffle_cube_with_key_phrase(strengthened_key_phrase, raw_cube, value_unique_to_each_rotor)
+        rotors_ready_for_use.append(shuffled_rotor)
     return rotors_ready_for_use
 
 
@@ -387,69 +405,27 @@ def _transpose_coordinates(
     y_mod = random_int_for_input(f"{key_phrase}|y", -2, 2)
     z_mod = random_int_for_input(f"{key_phrase}|z", -2, 2)
 
-    max_index = cube_length - 1
-    new_coordinates = []
-    for coordinate in coordinates:
-        x, y, z = coordinate
-
-        if is_encrypting:
-            new_x = x + x_mod
-        else:
-            new_x = x - x_mod
-        if new_x > max_index:
-            new_x -= cube_length
-        if new_x < 0:
-            new_x = cube_length + new_x
-
-        if is_encrypting:
-            new_y = y + y_mod
-        else:
-            new_y = y - y_mod
-        if new_y > max_index:
-            new_y -= cube_length
-        if new_y < 0:
-            new_y = cube_length + new_y
-
-        if is_encrypting:
-            new_z = z + z_mod
-        else:
-            new_z = z - z_mod
-        if new_z > max_index:
-            new_z -= cube_length
-        if new_z < 0:
-            new_z = cube_length + new_z
-
-        new_coordinate = new_x, new_y, new_z
-        new_coordinates.append(new_coordinate)
-    return new_coordinates
+    sign = 1 if is_encrypting else -1
+    x_shift, y_shift, z_shift = sign * x_mod, sign * y_mod, sign * z_mod
+    # Python's % always returns a non-negative remainder, so this wraps in both directions
+    return [
+        ((x + x_shift) % cube_length, (y + y_shift) % cube_length, (z + z_shift) % cube_length)
+        for x, y, z in coordinates
+    ]
 
 
 def _cyclically_permute_coordinates(
     coordinates: list[tuple[int, int, int]], cube_length: int, is_encrypting: bool, key_phrase: str
 ) -> list[tuple[int, int, int]]:
-    max_index = cube_length - 1
-    new_coordinates = []
-    for idx, coordinate in enumerate(coordinates):
-        x, y, z = coordinate
-        if idx == 0:
-            next_idx = idx + 1
-            prev_idx = max_index
-        elif idx == max_index:
-            next_idx = 0
-            prev_idx = idx - 1
-        else:
-            next_idx = idx + 1
-            prev_idx = idx - 1
-        next_coordinate = coordinates[next_idx]
-        prev_coordinate = coordinates[prev_idx]
-        x_n, y_n, z_n = next_coordinate
-        x_p, y_p, z_p = prev_coordinate
-        if is_encrypting:
-            new_coordinate = x, y_n, z_p
-        else:
-            new_coordinate = x, y_p, z_n
-        new_coordinates.append(new_coordinate)
-    return new_coordinates
+    del cube_length  # Kept for the shared operation signature; the wraparound is over the points, not the cube
+    # Rotate the list of points both ways so each point lines up with its neighbours (wrapping around the points)
+    next_points = coordinates[1:] + coordinates[:1]
+    prev_points = coordinates[-1:] + coordinates[:-1]
+    neighbours = zip(coordinates, next_points, prev_points)
+    # Branch on the direction once, rather than once per point
+    if is_encrypting:
+        return [(x, y_n, z_p) for (x, _, _), (_, y_n, _), (_, _, z_p) in neighbours]
+    return [(x, y_p, z_n) for (x, _, _), (_, _, z_n), (_, y_p, _) in neighbours]
 
 
 def _invert_coordinates(
@@ -457,12 +433,7 @@ def _invert_coordinates(
 ) -> list[tuple[int, int, int]]:
     max_index = cube_length - 1
     reflection_index = random_int_for_input(key_phrase, 0, max_index)
-    new_coordinates = []
-    for coordinate in coordinates:
-        x, y, z = coordinate
-        new_coordinate = reflection_index - x, reflection_index - y, reflection_index - z
-        new_coordinates.append(new_coordinate)
-    return new_coordinates
+    return [(reflection_index - x, reflection_index - y, reflection_index - z) for x, y, z in coordinates]
 
 
 def get_encrypted_coordinates(
@@ -543,20 +514,21 @@ def parse_arguments(
 
     tuple_result = _read_and_validate_config(mode=mode)
     cube_length, num_rotors_to_make, rotors_to_use, mode, should_use_steganography, plugboard_values = tuple_result
+    mode = mode.lower()
 
     if not key_phrase:
         key_phrase = input("Enter your key phrase: ").strip()
     if not message:
-        if mode.lower() == "encrypt":
+        if mode == "encrypt":
             message = input("Enter your plaintext message: ").strip()
-        elif mode.lower() == "decrypt":
+        elif mode == "decrypt":
             message = input("Enter your encrypted message: ").strip()
         else:
             raise ValueError("Unknown mode")
 
     return (
         key_phrase,
-        mode.lower(),
+        mode,
         message,
         cube_length,
         num_rotors_to_make,
@@ -579,10 +551,12 @@ def prep_string_for_encrypting(orig_message: str) -> str:
     if not orig_message:
         raise ValueError("Cannot encrypt an empty message")
     length_of_incomplete_chunk = len(orig_message) % LENGTH_OF_TRIO
+    if length_of_incomplete_chunk == 0:
+        return orig_message
+    # Append only the pad symbols, rather than slicing the message apart and gluing it back together
     incomplete_chunk = orig_message[-length_of_incomplete_chunk:]
-    message_without_incomplete_chunk = orig_message[0:-length_of_incomplete_chunk]
     complete_chunk = _pad_chunk_with_rand_pad_symbols(incomplete_chunk)
-    sanitized_string = message_without_incomplete_chunk + complete_chunk
+    sanitized_string = orig_message + complete_chunk[length_of_incomplete_chunk:]
     return sanitized_string
 
 
@@ -600,8 +574,8 @@ def read_config(config_file: str = "config.json") -> dict[str, Any]:
     if not config_path.is_file():
         raise FileNotFoundError(f"Configuration file '{config_file}' not found.")
 
-    with config_path.open("r", encoding="utf-8") as file:
-        return json.load(file)
+    # json.loads decodes UTF-8 bytes itself, so skip the separate text-mode decode
+    return json.loads(config_path.read_bytes())
 
 
 def rotate_slice_of_cube(cube: list[list[list[str]]], combined_seed: str) -> list[list[list[str]]]:
@@ -619,39 +593,39 @@ def rotate_slice_of_cube(cube: list[list[list[str]]], combined_seed: str) -> lis
         combined_seed, ["X", "Y", "Z"], [-1, 1], len(cube) - 1
     )
 
-    new_cube = deepcopy(cube)  # Create a copy of the cube to avoid mutating the input
-
+    # Never mutate the input. Only the lists that the rotation touches are copied; every untouched frame and row is
+    # shared with the input cube, since nothing modifies a rotor's rows in place once it has been built.
+    new_cube: list[list[list[str]]]
     if axis == "X":
         # Rotate along the X-axis: affecting cube[slice_idx_to_rotate][i][j]
-        slice_to_rotate = [row[:] for row in cube[slice_idx_to_rotate]]
-        rotated_slice = _rotate_2d_array(slice_to_rotate, rotate_dir)
+        rotated_slice = _rotate_2d_array(cube[slice_idx_to_rotate], rotate_dir)
+        new_cube = list(cube)
         new_cube[slice_idx_to_rotate] = rotated_slice
     elif axis == "Y":
         # Rotate along the Y-axis: affecting cube[i][slice_idx_to_rotate][j]
         slice_to_rotate = [frame[slice_idx_to_rotate] for frame in cube]
         rotated_slice = _rotate_2d_array(slice_to_rotate, rotate_dir)
+        new_cube = [list(frame) for frame in cube]
         for idx, layer in enumerate(rotated_slice):
             new_cube[idx][slice_idx_to_rotate] = layer
     elif axis == "Z":
-        # Rotate along the Z-axis: affecting cube[i][j][slice_idx_to_rotate]
-        slice_to_rotate = []
-        for frame_idx, frame in enumerate(cube):
-            row_to_rotate = []
-            for row_idx, row in enumerate(frame):
-                row_to_rotate.append(row[slice_idx_to_rotate])
-            slice_to_rotate.append(row_to_rotate)
+        # Rotate along the Z-axis: affecting cube[i][j][slice_idx_to_rotate], which touches every row
+        new_cube = [[row[:] for row in frame] for frame in cube]
+        slice_to_rotate = [[row[slice_idx_to_rotate] for row in frame] for frame in cube]
         rotated_slice = _rotate_2d_array(slice_to_rotate, rotate_dir)
-        for frame_idx, frame in enumerate(cube):
-            for row_idx, row in enumerate(frame):
-                max_idx = len(row) - 1
-                rotated_frame_col_idx = max_idx - row_idx
-                new_cube[frame_idx][row_idx][slice_idx_to_rotate] = rotated_slice[frame_idx][rotated_frame_col_idx]
+        # Every frame has the same number of rows, so the reversed row order is the same for all of them
+        rows_in_reverse = range(len(cube[0]) - 1, -1, -1)
+        for new_frame, rotated_frame in zip(new_cube, rotated_slice):
+            for row, rotated_row_idx in zip(new_frame, rows_in_reverse):
+                row[slice_idx_to_rotate] = rotated_frame[rotated_row_idx]
+    else:
+        new_cube = list(cube)
     return new_cube
 
 
 def sanitize(raw_input: str) -> str:
     if raw_input.startswith("\\"):
-        return raw_input.strip().replace("\\n", "\n").replace("\\t", "\t").replace("\\\\", "\\")
+        return _unescape(raw_input.strip())
     return raw_input.replace("\n", "")
 
 
@@ -667,7 +641,7 @@ def split_to_human_readable_symbols(s: str, expected_number_of_graphemes: int |
         list[str]: A list of 4 human-readable symbols, each as a separate string.
     """
     # Match grapheme clusters (human-discernible symbols)
-    graphemes = regex.findall(r"\X", s)
+    graphemes = list(s) if _is_single_codepoint_text(s) else _GRAPHEME_RE.findall(s)
     # Ensure the string has exactly 4 human-discernible symbols
     if expected_number_of_graphemes:
         if len(graphemes) != expected_number_of_graphemes:
@@ -685,6 +659,8 @@ def _user_perceived_length(s: str) -> int:
     Returns:
         int: the number of symbols as they would be counted by a human
     """
+    if _is_single_codepoint_text(s):
+        return len(s)
     # Match grapheme clusters
-    graphemes = regex.findall(r"\X", s)
+    graphemes = _GRAPHEME_RE.findall(s)
     return len(graphemes)
@@ -2,10 +2,13 @@
 
 from unittest.mock import patch, MagicMock
 import base64
+import hashlib
 import os
+import random
 import unittest
 
 from cubigma.core import (
+    DeterministicRandomCore,
     get_independently_deterministic_random_rotor_info,
     get_hash_of_string_in_bytes,
     get_non_deterministically_random_int,
@@ -16,15 +19,47 @@ from cubigma.core import (
 )
 
 
+class TestDeterministicRandomCore(unittest.TestCase):
+
+    def test_shuffle_is_deterministic_for_the_same_key(self):
+        # Arrange
+        test_sequence = list(range(50))
+
+        # Act
+        first_result = DeterministicRandomCore("keyphrase1").shuffle(test_sequence)
+        second_result = DeterministicRandomCore("keyphrase1").shuffle(test_sequence)
+
+        # Assert
+        self.assertEqual(first_result, second_result)
+        self.assertEqual(sorted(first_result), test_sequence)
+        self.assertNotEqual(first_result, test_sequence)
+
+    def test_shuffle_matches_get_random_int_draws(self):
+        # Arrange
+        test_sequence = [f"symbol_{i}" for i in range(200)]
+        reference_core = DeterministicRandomCore("keyphrase1")
+        expected_result = list(test_sequence)
+        for i in range(len(expected_result) - 1, 0, -1):
+            j = reference_core.get_random_int(0, i)
+            expected_result[i], expected_result[j] = expected_result[j], expected_result[i]
+
+        # Act
+        result = DeterministicRandomCore("keyphrase1").shuffle(test_sequence)
+
+        # Assert
+        self.assertEqual(expected_result, result)
+        self.assertEqual([f"symbol_{i}" for i in range(200)], test_sequence)
+
+
 class TestGetIndependentlyDeterministicRandomRotorInfo(unittest.TestCase):
 
-    @patch("random.randint")
-    @patch("random.choice")
-    @patch("random.seed")
-    def test_valid_case(self, mock_seed, mock_choice, mock_randint):
+    @patch("random.Random")
+    def test_valid_case(self, mock_random):
         # Arrange
-        mock_choice.side_effect = ["X", 1]
-        mock_randint.return_value = 3
+        mock_rng = MagicMock()
+        mock_rng.choice.side_effect = ["X", 1]
+        mock_rng.randint.return_value = 3
+        mock_random.return_value = mock_rng
         test_key = "keyphrase1"
         test_axis_choices = ["X", "Y", "Z"]
         test_direction_choices = [-1, 1]
@@ -38,11 +73,26 @@ class TestGetIndependentlyDeterministicRandomRotorInfo(unittest.TestCase):
 
         # Assert
         self.assertEqual(expected_results, results)
-        mock_seed.assert_called_once_with(test_key)
-        assert mock_choice.call_count == 2
-        mock_choice.assert_any_call(test_axis_choices)
-        mock_choice.assert_any_call(test_direction_choices)
-        mock_randint.assert_called_once_with(0, test_max_num)
+        mock_random.assert_called_once_with(test_key)
+        assert mock_rng.choice.call_count == 2
+        mock_rng.choice.assert_any_call(test_axis_choices)
+        mock_rng.choice.assert_any_call(test_direction_choices)
+        mock_rng.randint.assert_called_once_with(0, test_max_num)
+
+    def test_matches_seeding_the_global_generator(self):
+        # Arrange
+        test_key = "keyphrase1"
+        self.addCleanup(random.setstate, random.getstate())  # Leave the process-wide generator as we found it
+        random.seed(test_key)
+        expected_results = (random.choice(["X", "Y", "Z"]), random.choice([-1, 1]), random.randint(0, 5))
+        expected_global_state = random.getstate()
+
+        # Act
+        results = get_independently_deterministic_random_rotor_info(test_key, ["X", "Y", "Z"], [-1, 1], 5)
+
+        # Assert
+        self.assertEqual(expected_results, results)
+        self.assertEqual(expected_global_state, random.getstate())
 
 
 class TestGetHashOfStringInBytes(unittest.TestCase):
@@ -104,13 +154,12 @@ class TestShuffleForInput(unittest.TestCase):
     @patch("random.Random")
     def test_valid_case(self, mock_random, mock_sha256):
         # Arrange
-        test_shuffle_responses = [3, 1, 0, 2]
-        expected_results = [3, 1, 2, 4]
-        mock_randint = MagicMock()
-        mock_randint.randint.side_effect = test_shuffle_responses
-        mock_random.return_value = mock_randint
+        expected_results = [4, 3, 2, 1]
+        mock_shuffle = MagicMock(side_effect=lambda sequence: sequence.reverse())
+        mock_rng = MagicMock(shuffle=mock_shuffle)
+        mock_random.return_value = mock_rng
         mock_result = MagicMock()
-        mock_result.hexdigest.return_value = "2A"
+        mock_result.digest.return_value = (42).to_bytes(32, "big")
         mock_sha256.return_value = mock_result
         test_key = "testkey1"
         test_list = [1, 2, 3, 4]
@@ -121,12 +170,26 @@ class TestShuffleForInput(unittest.TestCase):
         # Assert
         self.assertEqual(expected_results, results)
         mock_sha256.assert_called_once_with(test_key.encode())
-        mock_result.hexdigest.assert_called_once_with()
+        mock_result.digest.assert_called_once_with()
         mock_random.assert_called_once_with(42)
-        assert mock_randint.randint.call_count == 3
-        mock_randint.randint.assert_any_call(0, 3)
-        mock_randint.randint.assert_any_call(0, 2)
-        mock_randint.randint.assert_any_call(0, 1)
+        mock_shuffle.assert_called_once_with(expected_results)  # The copy it shuffled in place
+        self.assertEqual([1, 2, 3, 4], test_list)
+
+    def test_matches_randint_fisher_yates(self):
+        # Arrange
+        test_key = "testkey1"
+        test_list = [f"symbol_{i}" for i in range(200)]
+        reference_rng = random.Random(int(hashlib.sha256(test_key.encode()).hexdigest(), 16))
+        expected_results = list(test_list)
+        for i in range(len(expected_results) - 1, 0, -1):
+            j = reference_rng.randint(0, i)
+            expected_results[i], expected_results[j] = expected_results[j], expected_results[i]
+
+        # Act
+        results = shuffle_for_input(test_key, test_list)
+
+        # Assert
+        self.assertEqual(expected_results, results)
 
 
 class TestRandomIntForInput(unittest.TestCase):
@@ -140,7 +203,7 @@ class TestRandomIntForInput(unittest.TestCase):
         mock_randint.randint.return_value = expected_result
         mock_random.return_value = mock_randint
         mock_result = MagicMock()
-        mock_result.hexdigest.return_value = "2A"
+        mock_result.digest.return_value = (42).to_bytes(32, "big")
         mock_sha256.return_value = mock_result
         test_key = "testkey1"
 
@@ -150,7 +213,7 @@ class TestRandomIntForInput(unittest.TestCase):
         # Assert
         self.assertEqual(expected_result, result)
         mock_sha256.assert_called_once_with(test_key.encode())
-        mock_result.hexdigest.assert_called_once_with()
+        mock_result.digest.assert_called_once_with()
         mock_random.assert_called_once_with(42)
         mock_randint.randint.assert_called_once_with(11, 29)
 
@@ -1,6 +1,7 @@
 # pylint: disable=missing-function-docstring, missing-module-docstring, missing-class-docstring
 
 from unittest.mock import patch, mock_open, MagicMock
+import string
 import unittest
 
 from cubigma.cubigma import NOISE_SYMBOL, Cubigma, main
@@ -47,92 +48,21 @@ class TestGetEncryptedLetterTrio(unittest.TestCase):
 
 
 class TestReadCharactersFile(unittest.TestCase):
-    def setUp(self):
-        self.cube_length = 4
-        self.symbols = [
-            "a",
-            "b",
-            "c",
-            "d",
-            "e",
-            "f",
-            "g",
-            "h",
-            "i",
-            "j",
-            "k",
-            "l",
-            "m",
-            "n",
-            "o",
-            "p",
-            "q",
-            "r",
-            "s",
-            "t",
-            "u",
-            "v",
-            "w",
-            "x",
-            "y",
-            "z",
-            "A",
-            "B",
-            "C",
-            "D",
-            "E",
-            "F",
-            "G",
-            "H",
-            "I",
-            "J",
-            "K",
-            "L",
-            "M",
-            "N",
-            "O",
-            "P",
-            "Q",
-            "R",
-            "S",
-            "T",
-            "U",
-            "V",
-            "W",
-            "X",
-            "Y",
-            "Z",
-            "0",
-            "1",
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            ",",
-            ".",
-            "?",
-            "!",
-            "-",
-            "_",
-        ]
+    # Shared, read-only fixtures: built once for the class instead of in setUp before every test
+    cube_length = 4
+    symbols = tuple(string.ascii_lowercase + string.ascii_uppercase + string.digits + ",.?!-_")
+    # Walking every frame, row and column in order reads the symbols 0..cube_length**3 - 1: just the leading slice
+    mock_data_array = symbols[: cube_length**3]
+    mock_data = "\n".join(mock_data_array)
+    expected_symbols = list(reversed(mock_data_array))
 
     @patch("cubigma.cubigma.sanitize")
     @patch("cubigma.cubigma.split_to_human_readable_symbols")
     @patch("builtins.open")
     def test_valid_file(self, mock_open_func, mock_split, mock_sanitize):
         # Arrange
-        mock_data_array = [
-            self.symbols[i * self.cube_length * self.cube_length + j * self.cube_length + k]
-            for i in range(self.cube_length)
-            for j in range(self.cube_length)
-            for k in range(self.cube_length)
-        ]
-        mock_data = "\n".join(mock_data_array)
-        mock_open_func.return_value = mock_open(mock=mock_open_func, read_data=mock_data).return_value
+        mock_data_array = self.mock_data_array
+        mock_open_func.return_value = mock_open(mock=mock_open_func, read_data=self.mock_data).return_value
         mock_sanitize.side_effect = mock_data_array
         mock_split.side_effect = mock_data_array
 
@@ -141,8 +71,7 @@ class TestReadCharactersFile(unittest.TestCase):
         result = cubigma._read_characters_file(self.cube_length)  # pylint:disable=W0212
 
         # Assert
-        expected_symbols = list(reversed(mock_data_array))
-        self.assertEqual(result, expected_symbols)
+        self.assertEqual(result, self.expected_symbols)
         assert mock_sanitize.call_count == len(mock_data_array)
         assert mock_split.call_count == len(mock_data_array)
 
@@ -212,12 +141,7 @@ class TestReadCharactersFile(unittest.TestCase):
     def test_duplicate_symbols(self, mock_open_func, mock_print, mock_split, mock_sanitize):
         # Arrange
         num_of_symbols = self.cube_length * self.cube_length * self.cube_length
-        mock_data_array = [
-            self.symbols[i * self.cube_length * self.cube_length + j * self.cube_length + k]
-            for i in range(self.cube_length)
-            for j in range(self.cube_length)
-            for k in range(self.cube_length)
-        ]
+        mock_data_array = list(self.mock_data_array)
         mock_data_array.pop(len(mock_data_array) - 1)
         mock_data_array.insert(0, "a")
         mock_data = "\n".join(mock_data_array)
@@ -239,13 +163,8 @@ class TestReadCharactersFile(unittest.TestCase):
     @patch("builtins.open")
     def test_exact_symbols_with_empty_lines(self, mock_open_func, mock_split, mock_sanitize):
         # Arrange
-        mock_data_array = [
-            self.symbols[i * self.cube_length * self.cube_length + j * self.cube_length + k]
-            for i in range(self.cube_length)
-            for j in range(self.cube_length)
-            for k in range(self.cube_length)
-        ]
-        mock_data = "\n".join(mock_data_array + ["" for _ in range(5)])
+        mock_data_array = list(self.mock_data_array)
+        mock_data = self.mock_data + "\n" * 5  # Five trailing empty lines
         mock_open_func.return_value = mock_open(mock=mock_open_func, read_data=mock_data).return_value
         mock_sanitize.side_effect = mock_data_array + ["" for _ in range(5)]
         mock_split.side_effect = mock_data_array + ["" for _ in range(5)]
@@ -255,8 +174,7 @@ class TestReadCharactersFile(unittest.TestCase):
         result = cubigma._read_characters_file(self.cube_length)  # pylint:disable=W0212
 
         # Assert
-        expected_symbols = list(reversed(mock_data_array))
-        self.assertEqual(result, expected_symbols)
+        self.assertEqual(result, self.expected_symbols)
         assert mock_sanitize.call_count == len(mock_data_array) + 4
         assert mock_split.call_count == len(mock_data_array) + 4
 
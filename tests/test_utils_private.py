@@ -1,12 +1,15 @@
 # pylint: disable=missing-function-docstring, missing-module-docstring, missing-class-docstring
 
 from copy import deepcopy
+from itertools import permutations
 from unittest.mock import patch
 import unittest
 
 from cubigma.utils import LENGTH_OF_TRIO
 from cubigma.utils import (
+    _cyclically_permute_coordinates,
     _find_symbol,
+    _find_symbols,
     _get_flat_index,
     _get_prefix_order_number_trio,
     _get_random_noise_chunk,
@@ -15,9 +18,44 @@ from cubigma.utils import (
     _read_and_validate_config,
     _rotate_2d_array,
     _shuffle_cube_with_key_phrase,
+    _transpose_coordinates,
+    _unescape,
 )
 
 
+class TestCyclicallyPermuteCoordinates(unittest.TestCase):
+    def test_encrypting_takes_y_from_next_and_z_from_previous(self):
+        # Arrange
+        coordinates = [(0, 1, 2), (3, 4, 5), (6, 7, 8)]
+
+        # Act
+        result = _cyclically_permute_coordinates(coordinates, 3, True, "key")
+
+        # Assert
+        self.assertEqual(result, [(0, 4, 8), (3, 7, 2), (6, 1, 5)])
+
+    def test_decrypting_reverses_encrypting(self):
+        # Arrange
+        coordinates = [(0, 1, 2), (3, 4, 5), (6, 7, 8)]
+
+        # Act
+        encrypted = _cyclically_permute_coordinates(coordinates, 3, True, "key")
+        result = _cyclically_permute_coordinates(encrypted, 3, False, "key")
+
+        # Assert
+        self.assertEqual(result, coordinates)
+
+    def test_wraps_around_the_points_for_larger_cubes(self):
+        # Arrange
+        coordinates = [(0, 1, 2), (3, 4, 5), (6, 7, 8)]
+
+        # Act
+        result = _cyclically_permute_coordinates(coordinates, 9, True, "key")
+
+        # Assert
+        self.assertEqual(result, [(0, 4, 8), (3, 7, 2), (6, 1, 5)])
+
+
 class TestFindSymbol(unittest.TestCase):
     def setUp(self):
         # Example 3x3x3 playfair cube
@@ -48,6 +86,31 @@ class TestFindSymbol(unittest.TestCase):
         self.assertEqual(_find_symbol("R", self.playfair_cube), (1, 2, 2))
 
 
+class TestFindSymbols(unittest.TestCase):
+    def setUp(self):
+        self.playfair_cube = [
+            [["A", "B", "C"], ["D", "E", "F"], ["G", "H", "I"]],
+            [["J", "K", "L"], ["M", "N", "O"], ["P", "Q", "R"]],
+            [["S", "T", "U"], ["V", "W", "X"], ["Y", "Z", "0"]],
+        ]
+
+    def test_find_symbols_valid(self):
+        expected = {"E": (0, 1, 1), "R": (1, 2, 2), "Z": (2, 2, 1)}
+        self.assertEqual(_find_symbols(["E", "R", "Z"], self.playfair_cube), expected)
+
+    def test_find_symbols_same_row(self):
+        expected = {"D": (0, 1, 0), "E": (0, 1, 1), "F": (0, 1, 2)}
+        self.assertEqual(_find_symbols(["D", "E", "F"], self.playfair_cube), expected)
+
+    def test_find_symbols_stops_once_all_found(self):
+        # The last frame is never inspected, so a broken frame there is not an error
+        playfair_cube = self.playfair_cube[:2] + [None]
+        self.assertEqual(_find_symbols(["A", "R"], playfair_cube), {"A": (0, 0, 0), "R": (1, 2, 2)})
+
+    def test_find_symbols_missing_symbol_is_omitted(self):
+        self.assertEqual(_find_symbols(["A", "1"], self.playfair_cube), {"A": (0, 0, 0)})
+
+
 class TestGetFlatIndex(unittest.TestCase):
     def test_basic_case(self):
         """Test basic case with typical inputs."""
@@ -65,7 +128,7 @@ class TestGetFlatIndex(unittest.TestCase):
         self.assertEqual(_get_flat_index(100, 200, 300, 400, 500), 20_080_300)
 
     def test_edge_case_sizes(self):
-        """Test edge cases where size_x or size_y is 1."""
+        """Test edge cases where size_z or size_y is 1."""
         self.assertEqual(_get_flat_index(1, 2, 3, 1, 1), 6)
         self.assertEqual(_get_flat_index(1, 2, 3, 1, 5), 10)
         self.assertEqual(_get_flat_index(1, 2, 3, 4, 1), 15)
@@ -76,6 +139,14 @@ class TestGetFlatIndex(unittest.TestCase):
         self.assertEqual(_get_flat_index(1, -2, 3, 4, 5), 15)
         self.assertEqual(_get_flat_index(1, 2, -3, 4, 5), 25)
 
+    def test_non_cubic_grid(self):
+        """Test that every coordinate of a 3x4x5 grid maps to its row-major position."""
+        size_x, size_y, size_z = 3, 4, 5
+        grid = [[[(x, y, z) for z in range(size_z)] for y in range(size_y)] for x in range(size_x)]
+        flattened = [coordinate for frame in grid for row in frame for coordinate in row]
+        for flat_index, (x, y, z) in enumerate(flattened):
+            self.assertEqual(_get_flat_index(x, y, z, size_z, size_y), flat_index)
+
     def test_invalid_sizes(self):
         """Test with invalid sizes to ensure proper handling."""
         with self.assertRaises(ValueError):
@@ -89,17 +160,12 @@ class TestGetFlatIndex(unittest.TestCase):
 
 
 class TestGetPrefixOrderNumberTrio(unittest.TestCase):
-    @staticmethod
-    def _fake_shuffle(input_list):
-        return reversed(input_list)
-
-    @patch("cubigma.utils.get_non_deterministically_random_shuffled")
-    def test_valid_order_number(self, mock_shuffle):
+    @patch("cubigma.utils.get_non_deterministically_random_int")
+    def test_valid_order_number(self, mock_randint):
         """Test that a valid single-digit order number returns a trio of symbols including the order number."""
         # Arrange
         order_number = 5
-        mock_shuffle.side_effect = self._fake_shuffle
-        orig_pad_symbols = ["\x07", "\x06", str(order_number)]
+        mock_randint.return_value = 5  # The last ordering, (2, 1, 0), reverses the symbols
         expected_result = f"{str(order_number)}\x06\x07"
 
         # Act
@@ -109,22 +175,34 @@ class TestGetPrefixOrderNumberTrio(unittest.TestCase):
         self.assertEqual(len(result), LENGTH_OF_TRIO, "Resulting string does not have 3 characters")
         self.assertIn(str(order_number), result, f"Order number {order_number} is not in the result")
         self.assertEqual(result, expected_result)
-        mock_shuffle.assert_called_once_with(orig_pad_symbols)
+        mock_randint.assert_called_once_with(0, 5)
 
-    @patch("cubigma.utils.get_non_deterministically_random_shuffled")
-    def test_invalid_order_number(self, mock_shuffle):
+    @patch("cubigma.utils.get_non_deterministically_random_int")
+    def test_every_ordering_is_reachable(self, mock_randint):
+        """Test that the six possible draws produce the six distinct orderings of the trio."""
+        # Arrange
+        mock_randint.side_effect = range(6)
+
+        # Act
+        results = {_get_prefix_order_number_trio(3) for _ in range(6)}
+
+        # Assert
+        self.assertEqual(results, {"".join(ordering) for ordering in permutations(["\x07", "\x06", "3"])})
+
+    @patch("cubigma.utils.get_non_deterministically_random_int")
+    def test_invalid_order_number(self, mock_randint):
         """Test that an invalid order number raises an assertion error."""
         with self.assertRaises(AssertionError):
             _get_prefix_order_number_trio(10)  # Not a single-digit number
-        mock_shuffle.assert_not_called()
+        mock_randint.assert_not_called()
 
         with self.assertRaises(AssertionError):
             _get_prefix_order_number_trio(-1)  # Negative number
-        mock_shuffle.assert_not_called()
+        mock_randint.assert_not_called()
 
         with self.assertRaises(AssertionError):
             _get_prefix_order_number_trio(123)  # Multiple digits
-        mock_shuffle.assert_not_called()
+        mock_randint.assert_not_called()
 
 
 class TestGetRandomNoiseChunk(unittest.TestCase):
@@ -152,7 +230,7 @@ class TestGetRandomNoiseChunk(unittest.TestCase):
     def test_output_length(self, mock_shuffle, mock_randint):
         """Test that the function output has the correct length."""
         # Arrange
-        mock_randint.side_effect = [0, 0, 0, 1, 1, 1]  # Mock coordinates
+        mock_randint.side_effect = [0, 13]  # Mock flat indices of (0, 0, 0) & (1, 1, 1)
         expected_symbols_1 = ["\x15", "A", "N"]
         expected_symbols_2 = ["B", "L", "A"]
         expected_result = "BLA"
@@ -164,7 +242,23 @@ class TestGetRandomNoiseChunk(unittest.TestCase):
         # Assert
         self.assertEqual(result, expected_result)
         mock_shuffle.assert_called_once_with(expected_symbols_1)
-        assert mock_randint.call_count == 6
+        assert mock_randint.call_count == 2
+        mock_randint.assert_called_with(0, 26)
+
+    @patch("cubigma.utils.get_non_deterministically_random_int")
+    @patch("cubigma.utils.get_non_deterministically_random_shuffled")
+    def test_skips_repeated_symbols(self, mock_shuffle, mock_randint):
+        """Test that a symbol already in the trio is drawn again."""
+        # Arrange
+        mock_randint.side_effect = [26, 26, 5]  # Mock flat indices of (2, 2, 2), (2, 2, 2) & (0, 1, 2)
+        mock_shuffle.side_effect = lambda symbols: symbols
+
+        # act
+        result = _get_random_noise_chunk(self.rotor)
+
+        # Assert
+        self.assertEqual(result, "\x150F")
+        assert mock_randint.call_count == 3
 
 
 class TestIsValidCoord(unittest.TestCase):
@@ -203,34 +297,51 @@ class TestIsValidCoord(unittest.TestCase):
 
 
 class TestPadChunkWithRandPadSymbols(unittest.TestCase):
-    @patch("cubigma.utils.get_non_deterministically_random_int")
-    def test_pad_chunk_with_empty_input(self, mock_randint):
+    @staticmethod
+    def _fake_shuffle(input_list):
+        return list(reversed(input_list))
+
+    @patch("cubigma.utils.get_non_deterministically_random_shuffled")
+    def test_pad_chunk_with_empty_input(self, mock_shuffle):
         with self.assertRaises(ValueError) as context:
             _pad_chunk_with_rand_pad_symbols("")
         self.assertIn("Chunk cannot be empty", str(context.exception))
-        mock_randint.assert_not_called()
+        mock_shuffle.assert_not_called()
 
-    @patch("cubigma.utils.get_non_deterministically_random_int")
-    def test_pad_chunk_with_one_length_input(self, mock_randint):
-        mock_randint.side_effect = [0, 1]
+    @patch("cubigma.utils.get_non_deterministically_random_shuffled")
+    def test_pad_chunk_with_one_length_input(self, mock_shuffle):
+        mock_shuffle.side_effect = self._fake_shuffle
         result = _pad_chunk_with_rand_pad_symbols("A")
-        self.assertEqual(result, "A\x07\x16")
-        assert mock_randint.call_count == 2
+        self.assertEqual(result, "A\x06\x16")
+        mock_shuffle.assert_called_once_with(["\x07", "\x16", "\x06"])
 
-    @patch("cubigma.utils.get_non_deterministically_random_int")
-    def test_pad_chunk_with_two_length_input(self, mock_randint):
-        expected_max_num = 2
-        mock_randint.return_value = expected_max_num
+    @patch("cubigma.utils.get_non_deterministically_random_shuffled")
+    def test_pad_chunk_with_two_length_input(self, mock_shuffle):
+        mock_shuffle.side_effect = self._fake_shuffle
         result = _pad_chunk_with_rand_pad_symbols("AB")
         self.assertEqual(result, "AB\x06")
-        mock_randint.assert_called_once_with(0, expected_max_num)
+        mock_shuffle.assert_called_once_with(["\x07", "\x16", "\x06"])
 
-    @patch("cubigma.utils.get_non_deterministically_random_int")
-    def test_pad_chunk_with_three_length_input(self, mock_randint):
-        mock_randint.side_effect = [0]
+    @patch("cubigma.utils.get_non_deterministically_random_shuffled")
+    def test_pad_chunk_skips_pad_symbols_already_in_chunk(self, mock_shuffle):
+        mock_shuffle.side_effect = self._fake_shuffle
+        result = _pad_chunk_with_rand_pad_symbols("\x06")
+        self.assertEqual(result, "\x06\x16\x07")
+        mock_shuffle.assert_called_once_with(["\x07", "\x16"])
+
+    @patch("cubigma.utils._PAD_SYMBOLS", ("\x07",))
+    @patch("cubigma.utils.get_non_deterministically_random_shuffled")
+    def test_pad_chunk_with_too_few_pad_symbols(self, mock_shuffle):
+        with self.assertRaises(ValueError) as context:
+            _pad_chunk_with_rand_pad_symbols("A")
+        self.assertIn("needs 2 pad symbols, but only 1 remain", str(context.exception))
+        mock_shuffle.assert_not_called()
+
+    @patch("cubigma.utils.get_non_deterministically_random_shuffled")
+    def test_pad_chunk_with_three_length_input(self, mock_shuffle):
         result = _pad_chunk_with_rand_pad_symbols("ABC")
         self.assertEqual(result, "ABC")
-        mock_randint.assert_not_called()
+        mock_shuffle.assert_not_called()
 
 
 class TestReadAndValidateConfig(unittest.TestCase):
@@ -582,6 +693,52 @@ class TestShuffleCubeWithKeyPhrase(unittest.TestCase):
         mock_shuffle.assert_called_once_with(f"{self.key_phrase_1}|{42}", expected_cube)
 
 
+class TestTransposeCoordinates(unittest.TestCase):
+    @patch("cubigma.utils.random_int_for_input")
+    def test_wraps_past_both_edges(self, mock_random_int):
+        # Arrange
+        mock_random_int.side_effect = [2, -2, 1]
+        coordinates = [(4, 0, 2), (3, 1, 4)]
+        expected_coordinates = [(1, 3, 3), (0, 4, 0)]
+
+        # Act
+        result = _transpose_coordinates(coordinates, 5, True, "key")
+
+        # Assert
+        self.assertEqual(expected_coordinates, result)
+        mock_random_int.assert_any_call("key|x", -2, 2)
+        mock_random_int.assert_any_call("key|y", -2, 2)
+        mock_random_int.assert_any_call("key|z", -2, 2)
+
+    @patch("cubigma.utils.random_int_for_input")
+    def test_decrypting_reverses_encrypting(self, mock_random_int):
+        # Arrange
+        mock_random_int.side_effect = [2, -2, 1, 2, -2, 1]
+        coordinates = [(4, 0, 2), (3, 1, 4), (0, 0, 0)]
+
+        # Act
+        encrypted = _transpose_coordinates(coordinates, 5, True, "key")
+        decrypted = _transpose_coordinates(encrypted, 5, False, "key")
+
+        # Assert
+        self.assertEqual(coordinates, decrypted)
+
+
+class TestUnescape(unittest.TestCase):
+    def test_escape_sequences(self):
+        self.assertEqual(_unescape("\\n"), "\n")
+        self.assertEqual(_unescape("\\t"), "\t")
+        self.assertEqual(_unescape("\\\\"), "\\")
+
+    def test_single_pass(self):
+        # An escaped backslash followed by "n" is not a newline
+        self.assertEqual(_unescape("\\\\n"), "\\n")
+
+    def test_plain_symbol(self):
+        self.assertEqual(_unescape("\\"), "\\")
+        self.assertEqual(_unescape("a"), "a")
+
+
 # pylint: enable=missing-function-docstring, missing-module-docstring, missing-class-docstring
 
 
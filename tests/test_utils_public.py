@@ -2,6 +2,7 @@
 
 from unittest.mock import patch, MagicMock
 import json
+import math
 import unittest
 
 from cubigma.utils import (
@@ -28,60 +29,45 @@ class TestGenerateCubeFromSymbols(unittest.TestCase):
         # Common test setup for symbols
         self.symbols = ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l"]
 
-    @patch("cubigma.utils._user_perceived_length")
-    def test_generate_cube_valid_input(self, mock_length):
+    def test_generate_cube_valid_input(self):
         """Test cube generation with valid input."""
         # Arrange
         num_blocks = 2
         lines_per_block = 2
         symbols_per_line = 3
         expected_output = [[["a", "b", "c"], ["d", "e", "f"]], [["g", "h", "i"], ["j", "k", "l"]]]
-        mock_length.side_effect = [LENGTH_OF_TRIO, LENGTH_OF_TRIO, LENGTH_OF_TRIO, LENGTH_OF_TRIO]
 
         # Act
         result = generate_cube_from_symbols(self.symbols, num_blocks, lines_per_block, symbols_per_line)
 
         # Assert
         self.assertEqual(result, expected_output)
-        assert mock_length.call_count == 4
-        mock_length.assert_any_call("abc")
-        mock_length.assert_any_call("def")
-        mock_length.assert_any_call("ghi")
-        mock_length.assert_any_call("jkl")
 
-    @patch("cubigma.utils._user_perceived_length")
-    def test_generate_cube_edge_case_single_block(self, mock_length):
+    def test_generate_cube_edge_case_single_block(self):
         """Test cube generation with only one block."""
         # Arrange
         num_blocks = 1
         lines_per_block = 2
         symbols_per_line = 3
         expected_output = [[["a", "b", "c"], ["d", "e", "f"]]]
-        mock_length.side_effect = [LENGTH_OF_TRIO, LENGTH_OF_TRIO]
 
         # Act
         result = generate_cube_from_symbols(self.symbols, num_blocks, lines_per_block, symbols_per_line)
 
         # Assert
         self.assertEqual(result, expected_output)
-        assert mock_length.call_count == 2
-        mock_length.assert_any_call("abc")
-        mock_length.assert_any_call("def")
 
-    @patch("cubigma.utils._user_perceived_length")
-    def test_generate_cube_invalid_symbols_length(self, mock_length):
+    def test_generate_cube_invalid_symbols_length(self):
         """Test failure when symbols length does not match required input dimensions."""
         # Arrange
         num_blocks = 2
         lines_per_block = 2
         symbols_per_line = 4
-        mock_length.side_effect = [LENGTH_OF_TRIO, LENGTH_OF_TRIO]
 
         # Act & Assert
         with self.assertRaises(ValueError) as context:
             generate_cube_from_symbols(self.symbols, num_blocks, lines_per_block, symbols_per_line)
         self.assertEqual(str(context.exception), "Something has failed")
-        mock_length.assert_called_once_with("abcd")
 
     @patch("cubigma.utils._user_perceived_length")
     def test_generate_cube_escape_characters(self, mock_length):
@@ -92,18 +78,25 @@ class TestGenerateCubeFromSymbols(unittest.TestCase):
         lines_per_block = 2
         symbols_per_line = 3
         expected_output = [[["a", "\\", "\n"], ["b", "\t", "c"]], [["d", "e", "f"], ["g", "h", "i"]]]
-        mock_length.side_effect = [LENGTH_OF_TRIO, LENGTH_OF_TRIO, LENGTH_OF_TRIO, LENGTH_OF_TRIO]
 
         # Act
         result = generate_cube_from_symbols(symbols_with_escape, num_blocks, lines_per_block, symbols_per_line)
 
         # Assert
         self.assertEqual(expected_output, result)
-        assert mock_length.call_count == 4
-        mock_length.assert_any_call("a\\\n")
-        mock_length.assert_any_call("b\tc")
-        mock_length.assert_any_call("def")
-        mock_length.assert_any_call("ghi")
+        mock_length.assert_not_called()
+
+    def test_generate_cube_multi_codepoint_symbols(self):
+        """Test that a symbol made of several code points still fills a single cell."""
+        # Arrange
+        symbols = ["👍🏽", "e\u0301", "c", "d", "e", "f"]
+        expected_output = [[["👍🏽", "e\u0301", "c"], ["d", "e", "f"]]]
+
+        # Act
+        result = generate_cube_from_symbols(symbols, 1, 2, 3)
+
+        # Assert
+        self.assertEqual(expected_output, result)
 
     @patch("cubigma.utils._user_perceived_length")
     def test_generate_cube_empty_symbols(self, mock_length):
@@ -269,6 +262,22 @@ class TestGenerateRotors(unittest.TestCase):
         for rotor in result:
             self.assertEqual(rotor, self.valid_cube)
 
+    def test_generate_rotors_do_not_share_rows(self):
+        """Test that the raw cube is left untouched and no rows are shared between rotors."""
+        orig_cube = [[list(row) for row in frame] for frame in self.valid_cube]
+
+        result = generate_rotors(
+            self.valid_key,
+            self.valid_cube,
+            num_rotors_to_make=self.num_rotors_to_make,
+            rotors_to_use=self.rotors_to_use,
+            orig_key_length=42,
+        )
+
+        self.assertEqual(self.valid_cube, orig_cube)
+        all_rows = [row for cube in [self.valid_cube, *result] for frame in cube for row in frame]
+        self.assertEqual(len({id(row) for row in all_rows}), len(all_rows))
+
     @patch("cubigma.utils._shuffle_cube_with_key_phrase")
     def test_missing_key_phrase(self, mock_shuffle):
         """Test function raises error on missing or invalid key phrase."""
@@ -365,6 +374,22 @@ class TestGenerateRotors(unittest.TestCase):
 
         self.assertEqual(len(result), len(self.rotors_to_use))
 
+    @patch("cubigma.utils._shuffle_cube_with_key_phrase")
+    def test_only_used_rotors_are_shuffled(self, mock_shuffle):
+        """Test function only shuffles the rotors listed in rotors_to_use, in that order."""
+        mock_shuffle.side_effect = lambda key, cube, unique_val: unique_val
+
+        result = generate_rotors(
+            self.valid_key,
+            self.valid_cube,
+            num_rotors_to_make=self.num_rotors_to_make,
+            rotors_to_use=[4, 0],
+            orig_key_length=42,
+        )
+
+        self.assertEqual(mock_shuffle.call_count, 2)
+        self.assertEqual(result, [str(math.pow((4 + 7) * 13, 42 + 4)), str(math.pow((0 + 7) * 13, 42 + 0))])
+
     @patch("cubigma.utils._shuffle_cube_with_key_phrase")
     def test_deterministic_output(self, mock_shuffle):
         """Test function produces deterministic output for the same inputs."""
@@ -708,6 +733,7 @@ class TestPrepStringForEncrypting(unittest.TestCase):
         expected_output = "abc"
         result = prep_string_for_encrypting(input_message)
         self.assertEqual(result, expected_output)
+        mock_pad.assert_not_called()
 
     @patch("cubigma.utils._pad_chunk_with_rand_pad_symbols")
     def test_padding_needed_short(self, mock_pad):
@@ -726,6 +752,7 @@ class TestPrepStringForEncrypting(unittest.TestCase):
         expected_output = "abcde*"
         result = prep_string_for_encrypting(input_message)
         self.assertEqual(result, expected_output)
+        mock_pad.assert_called_once_with("de")
 
     @patch("cubigma.utils._pad_chunk_with_rand_pad_symbols")
     def test_repeating_characters(self, mock_pad):
@@ -759,19 +786,32 @@ class TestReadConfig(unittest.TestCase):
         self.valid_config = {"key1": "value1", "key2": 42, "key3": [1, 2, 3]}
 
     @patch("cubigma.utils.Path")
-    @patch("cubigma.utils.json.load")
-    def test_read_valid_config(self, mock_load, mock_path):
+    @patch("cubigma.utils.json.loads")
+    def test_read_valid_config(self, mock_loads, mock_path):
         # Arrange
         mock_path.return_value.is_file.return_value = True
-        mock_load.return_value = {"key1": "value1", "key2": 42, "key3": [1, 2, 3]}
+        mock_path.return_value.read_bytes.return_value = b"raw config"
+        mock_loads.return_value = {"key1": "value1", "key2": 42, "key3": [1, 2, 3]}
 
         # Act
         config = read_config("mock_config.json")
 
         # Assert
         self.assertEqual(config, self.valid_config)
-        mock_path.return_value.open.assert_called_once_with("r", encoding="utf-8")
-        mock_load.assert_called_once()
+        mock_path.return_value.read_bytes.assert_called_once_with()
+        mock_loads.assert_called_once_with(b"raw config")
+
+    @patch("cubigma.utils.Path")
+    def test_read_utf8_config(self, mock_path):
+        # Arrange
+        mock_path.return_value.is_file.return_value = True
+        mock_path.return_value.read_bytes.return_value = '{"PLUGBOARD": ["😀é"]}'.encode("utf-8")
+
+        # Act
+        config = read_config("mock_config.json")
+
+        # Assert
+        self.assertEqual(config, {"PLUGBOARD": ["😀é"]})
 
     @patch("cubigma.utils.Path")
     def test_missing_config_file(self, mock_path):
@@ -786,13 +826,12 @@ class TestReadConfig(unittest.TestCase):
     def test_invalid_json_format(self, mock_path):
         # Arrange
         mock_path.return_value.is_file.return_value = True
-        mock_path.return_value.open.return_value.__enter__.return_value.read.return_value = "{'Not valid json'"
+        mock_path.return_value.read_bytes.return_value = b"{'Not valid json'"
 
         # Act & Assert
         with self.assertRaises(json.JSONDecodeError):
             read_config("invalid_config.json")
-        mock_path.return_value.open.assert_called_once_with("r", encoding="utf-8")
-        mock_path.return_value.open.return_value.__enter__.return_value.read.assert_called_once()
+        mock_path.return_value.read_bytes.assert_called_once_with()
 
 
 class TestRotateSliceOfCube(unittest.TestCase):
@@ -994,6 +1033,11 @@ class TestSanitizeFunction(unittest.TestCase):
         # Act & Assert
         self.assertEqual(sanitize(input_str), expected_output, "Failed to handle mixed escape sequences.")
 
+    def test_escaped_backslash_is_not_reused(self):
+        """Test that an escaped backslash does not start another escape sequence."""
+        # Act & Assert
+        self.assertEqual(sanitize("\\\\n"), "\\n", "Failed to expand escape sequences left to right.")
+
     def test_plain_string(self):
         """Test if a plain string without leading backslash is returned unchanged except for newline removal."""
         input_str = "This is a test string.\nWith newline."
@@ -1075,6 +1119,15 @@ class TestSplitToHumanReadableSymbols(unittest.TestCase):
         """Test valid input with combining characters to form graphemes."""
         self.assertEqual(split_to_human_readable_symbols("ôũī"), ["ô", "ũ", "ī"])
 
+    def test_ascii_input(self):
+        """Test plain ASCII input, which is split without the grapheme regex."""
+        self.assertEqual(split_to_human_readable_symbols("a1!"), ["a", "1", "!"])
+        self.assertEqual(split_to_human_readable_symbols("a\nb\tc", expected_number_of_graphemes=None), list("a\nb\tc"))
+
+    def test_carriage_return_line_feed_is_one_symbol(self):
+        """Test that CR LF stays a single grapheme even though it is ASCII."""
+        self.assertEqual(split_to_human_readable_symbols("a\r\nb"), ["a", "\r\n", "b"])
+
 
 class TestUserPerceivedLength(unittest.TestCase):
     def test_basic_text(self):
@@ -1082,6 +1135,10 @@ class TestUserPerceivedLength(unittest.TestCase):
         self.assertEqual(_user_perceived_length(""), 0)
         self.assertEqual(_user_perceived_length("a"), 1)
 
+    def test_carriage_return_line_feed(self):
+        self.assertEqual(_user_perceived_length("a\r\n"), 2)
+        self.assertEqual(_user_perceived_length("a\r"), 2)
+
     def test_emojis(self):
         self.assertEqual(_user_perceived_length("🙂"), 1)
         self.assertEqual(_user_perceived_length("🙂🙂"), 2)